@@ -2,7 +2,8 @@ __all__ = [
     'EDPOPREC', 'RELATORS', 'bind_common_namespaces',
     'Field', 'FieldError', 'LocationField',
     'Reader', 'ReaderError', 'NotFoundError',
-    'GetByIdBasedOnQueryMixin', 'BasePreparedQuery', 'PreparedQueryType',
+    'GetByIdBasedOnQueryMixin', 'PagedFetchMixin', 'BasePreparedQuery',
+    'PreparedQueryType',
     'Record', 'RawData', 'RecordError', 'BibliographicalRecord',
     'BiographicalRecord', 'LazyRecordMixin',
     'SRUReader',
@@ -19,8 +20,8 @@ BIOGRAPHICAL = "biographical"
 from .rdf import EDPOPREC, RELATORS, bind_common_namespaces
 from .fields import Field, FieldError, LocationField
 from .reader import (
-    Reader, ReaderError, GetByIdBasedOnQueryMixin, BasePreparedQuery,
-    PreparedQueryType, NotFoundError
+    Reader, ReaderError, GetByIdBasedOnQueryMixin, PagedFetchMixin,
+    BasePreparedQuery, PreparedQueryType, NotFoundError
 )
 from .record import (
     Record, RawData, RecordError, BibliographicalRecord, BiographicalRecord,
@@ -25,6 +25,9 @@ from edpop_explorer.readers import (
     PierreBelleReader,
 )
 
+# Use the fast emitter of libyaml if PyYAML was built with it
+YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 class EDPOPXShell(cmd2.Cmd):
     intro = (
@@ -135,7 +138,7 @@ class EDPOPXShell(cmd2.Cmd):
         if record is None:
             return
         data = record.get_data_dict()
-        yaml_data = yaml.dump(data, allow_unicode=True)
+        yaml_data = yaml.dump(data, Dumper=YamlDumper, allow_unicode=True)
         highlighted = highlight(
             yaml_data, YamlLexer(), Terminal256Formatter(style='vim')
         )
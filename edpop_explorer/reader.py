@@ -1,8 +1,9 @@
 """Base reader class and strongly related functionality."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Union, Dict
+from typing import Optional, Union, Dict, List, TYPE_CHECKING
 from rdflib import Graph, RDF, URIRef, SDO, Literal
 from urllib.parse import quote, unquote
 
@@ -13,16 +14,37 @@ from edpop_explorer import (
 from .record import Record
 
 
-@dataclass
+@dataclass(frozen=True)
 class BasePreparedQuery:
     """Empty base dataclass for prepared queries. For prepared queries that
     can be represented by a single string, do not inherit from this class
-    but use a simple string instead."""
-    pass
+    but use a simple string instead.
+
+    Prepared queries are immutable: subclasses should be frozen dataclasses
+    as well and may define ``__slots__`` to avoid a per-instance
+    ``__dict__``."""
+    __slots__ = ()
+
+    def __getstate__(self) -> dict:
+        # Frozen dataclasses with __slots__ cannot be unpickled using the
+        # default mechanism, because that uses setattr.
+        return {
+            name: getattr(self, name) for name in self.__dataclass_fields__
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
 
 
 PreparedQueryType = Union[str, BasePreparedQuery]
 
+_DEFAULT_CATALOG_RDFCLASS = EDPOPREC.Catalog
+_CATALOG_RDFCLASS = {
+    BIOGRAPHICAL: EDPOPREC.BiographicalCatalog,
+    BIBLIOGRAPHICAL: EDPOPREC.BibliographicalCatalog,
+}
+
 
 class Reader(ABC):
     """Base reader class (abstract).
@@ -74,6 +96,10 @@ class Reader(ABC):
     _fetch_position: int = 0
     """The index of the record that was fetched last. This is used by
     the ``fetch()`` method to decide where to continue fetching."""
+    _exhausted: bool = False
+    """``True`` as soon as it is known that all results have been fetched.
+    Readers may set this themselves if the source signals that there are
+    no more results."""
 
     def __init__(self):
         self.records = {}
@@ -215,11 +241,9 @@ class Reader(ABC):
             )
 
         # Set reader class
-        rdfclass = EDPOPREC.Catalog
-        if cls.READERTYPE == BIOGRAPHICAL:
-            rdfclass = EDPOPREC.BiographicalCatalog
-        elif cls.READERTYPE == BIBLIOGRAPHICAL:
-            rdfclass = EDPOPREC.BibliographicalCatalog
+        rdfclass = _CATALOG_RDFCLASS.get(
+            cls.READERTYPE, _DEFAULT_CATALOG_RDFCLASS
+        )
         g.add((cls.CATALOG_URIREF, RDF.type, rdfclass))
 
         # Add name and description
@@ -238,7 +262,12 @@ class Reader(ABC):
     @property
     def fetching_exhausted(self) -> bool:
         """Return ``True`` if all results have been fetched."""
-        return self.fetching_started and self.number_of_results == self.number_fetched
+        if not self._exhausted:
+            self._exhausted = (
+                self.number_of_results is not None
+                and self.number_fetched >= self.number_of_results
+            )
+        return self._exhausted
 
     @property
     def fetching_started(self) -> bool:
@@ -264,7 +293,7 @@ class Reader(ABC):
         if self.prepared_query is None:
             raise RuntimeError("A prepared query should be set first")
         # Create identifier based on reader class name and prepared query.
-        readertype = self.__class__
+        readertype = type(self)
         # self.prepared_query is either a string or a dataclass instance,
         # which means that it has a __str__ method that gives a unique
         # string representation of its contents (at least as long as
@@ -289,8 +318,9 @@ class GetByIdBasedOnQueryMixin(ABC):
     @classmethod
     def get_by_id(cls, identifier: str) -> Record:
         reader = cls()
-        assert isinstance(reader, Reader), \
-            "GetByIdBasedOnQueryMixin should be used on Reader subclass"
+        if TYPE_CHECKING:
+            # GetByIdBasedOnQueryMixin should be used on Reader subclass
+            assert isinstance(reader, Reader)
         reader.set_query(cls._prepare_get_by_id_query(identifier))
         reader.fetch()
         if reader.number_of_results == 0:
@@ -312,6 +342,87 @@ class GetByIdBasedOnQueryMixin(ABC):
         pass
 
 
+class PagedFetchMixin(ABC):
+    """Mixin for readers that are based on an API that returns results
+    in pages of a given size starting at a given record. The mixin
+    implements ``fetch_range``: ranges larger than
+    ``MAXIMUM_RECORDS_PER_REQUEST`` are split into pages, which are
+    requested concurrently once the number of results is known. To use,
+    override the ``_perform_page_query`` method, which fetches a single
+    page."""
+    MAXIMUM_RECORDS_PER_REQUEST: int = 50
+    """The maximum number of records to request at once."""
+    MAX_CONCURRENT_REQUESTS: int = 6
+    """The maximum number of pages to request at the same time."""
+
+    def fetch_range(self, range_to_fetch: range) -> range:
+        if TYPE_CHECKING:
+            # PagedFetchMixin should be used on Reader subclass
+            assert isinstance(self, Reader)
+        if self.fetching_exhausted:
+            return range(0, 0)
+        if self.prepared_query is None:
+            raise ReaderError('First call prepare_query')
+        start_number = range_to_fetch.start
+        stop_number = range_to_fetch.stop
+        page_size = self.MAXIMUM_RECORDS_PER_REQUEST
+        if self.number_of_results is None or \
+                stop_number - start_number <= page_size:
+            # Fetch the first page on its own, because the number of
+            # results is needed to know which other pages exist
+            first_stop = min(stop_number, start_number + page_size) \
+                if self.number_of_results is None else stop_number
+            results = self._fetch_page(start_number, first_stop)
+            if len(results) < first_stop - start_number:
+                return range(start_number, start_number + len(results))
+            start_of_rest = first_stop
+        else:
+            results = []
+            start_of_rest = start_number
+        if start_of_rest >= stop_number:
+            return range(start_number, start_number + len(results))
+        assert self.number_of_results is not None
+        stop_number = min(stop_number, self.number_of_results)
+        # The remaining pages are independent of each other, so request
+        # them concurrently
+        starts = range(start_of_rest, stop_number, page_size)
+        if len(starts):
+            with ThreadPoolExecutor(
+                max_workers=min(len(starts), self.MAX_CONCURRENT_REQUESTS)
+            ) as executor:
+                pages = executor.map(
+                    lambda start: self._fetch_page(
+                        start, min(start + page_size, stop_number)
+                    ),
+                    starts
+                )
+                for start, page in zip(starts, pages):
+                    results.extend(page)
+                    if len(page) < min(page_size, stop_number - start):
+                        # Only return a contiguous range of records
+                        break
+        return range(start_number, start_number + len(results))
+
+    def _fetch_page(self, start_number: int, stop_number: int) -> List[Record]:
+        if TYPE_CHECKING:
+            assert isinstance(self, Reader)
+        results = self._perform_page_query(
+            start_number, stop_number - start_number
+        )
+        for i, result in enumerate(results):
+            self.records[i + start_number] = result
+        return results
+
+    @abstractmethod
+    def _perform_page_query(
+            self, start_number: int, number_of_records: int
+    ) -> List[Record]:
+        """Fetch at most ``number_of_records`` records, starting at
+        ``start_number`` (counting from 0), and set the
+        ``number_of_results`` attribute."""
+        pass
+
+
 class ReaderError(Exception):
     """Generic exception for failures in ``Reader`` class. More specific errors
     derive from this class."""
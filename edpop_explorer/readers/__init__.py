@@ -1,4 +1,8 @@
-'''This package contains concrete subclasses of ``Reader``.'''
+'''This package contains concrete subclasses of ``Reader``.
+
+The reader modules are only imported when a reader class is first
+accessed, so that importing a single reader does not import all of them.
+'''
 
 __all__ = [
     "BnFReader",
@@ -18,34 +22,62 @@ __all__ = [
     "ALL_READERS",
 ]
 
+import importlib
+from typing import Dict, List, Type, TYPE_CHECKING
+
 from edpop_explorer import Reader
 
-from .bnf import BnFReader
-from .cerl_thesaurus import CERLThesaurusReader
-from .fbtee import FBTEEReader
-from .gallica import GallicaReader
-from .hpb import HPBReader
-from .kb import KBReader
-from .sbtireader import SBTIReader
-from .stcn import STCNReader
-from .ustc import USTCReader
-from .vd import VD16Reader, VD17Reader, VD18Reader, VDLiedReader
-from .pierre_belle import PierreBelleReader
+if TYPE_CHECKING:
+    from .bnf import BnFReader
+    from .cerl_thesaurus import CERLThesaurusReader
+    from .fbtee import FBTEEReader
+    from .gallica import GallicaReader
+    from .hpb import HPBReader
+    from .kb import KBReader
+    from .sbtireader import SBTIReader
+    from .stcn import STCNReader
+    from .ustc import USTCReader
+    from .vd import VD16Reader, VD17Reader, VD18Reader, VDLiedReader
+    from .pierre_belle import PierreBelleReader
 
-import sys
-from typing import List, Type
+# The module that defines each reader class, in the order of __all__
+_READER_MODULES: Dict[str, str] = {
+    "BnFReader": ".bnf",
+    "CERLThesaurusReader": ".cerl_thesaurus",
+    "FBTEEReader": ".fbtee",
+    "GallicaReader": ".gallica",
+    "HPBReader": ".hpb",
+    "KBReader": ".kb",
+    "SBTIReader": ".sbtireader",
+    "VD16Reader": ".vd",
+    "VD17Reader": ".vd",
+    "VD18Reader": ".vd",
+    "VDLiedReader": ".vd",
+    "STCNReader": ".stcn",
+    "USTCReader": ".ustc",
+    "PierreBelleReader": ".pierre_belle",
+}
 
 
 def _get_all_readers() -> List[Type[Reader]]:
     """Create a list of all reader classes included in this package."""
-    all_names = __all__.copy()
-    all_names.pop()  # Remove "ALL_READERS" itself
-    all_readers: List[Type[Reader]] = []
-    for name in all_names:
-        cls = getattr(sys.modules[__name__], name, None)
-        if cls is not None:
-            all_readers.append(cls)
-    return all_readers
+    return [__getattr__(name) for name in _READER_MODULES]
+
+
+def __getattr__(name: str):
+    if name == "ALL_READERS":
+        value = _get_all_readers()
+    elif name in _READER_MODULES:
+        module = importlib.import_module(_READER_MODULES[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+    # Cache in the module namespace so that __getattr__ is not called again
+    globals()[name] = value
+    return value
 
-ALL_READERS = _get_all_readers()
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,11 @@
-from typing import Optional
+from typing import Dict, List, Optional
 
 from rdflib import URIRef
 
-from edpop_explorer import SRUMarc21BibliographicalReader, Marc21Data
+from edpop_explorer import (
+    SRUMarc21BibliographicalReader, Marc21Data, Marc21BibliographicalRecord,
+    NotFoundError, Field
+)
 
 
 class BnFReader(SRUMarc21BibliographicalReader):
@@ -23,6 +26,9 @@ class BnFReader(SRUMarc21BibliographicalReader):
     _dating_field_subfield = ('210', 'd')
     _language_field_subfield = ('101', 'a')
     # TODO: add format etc
+    GET_MANY_BY_ID_CHUNK_SIZE = 50
+    """The maximum number of identifiers to combine in a single query
+    in ``get_many_by_id()``."""
 
     @classmethod
     def transform_query(cls, query: str) -> str:
@@ -37,6 +43,61 @@ class BnFReader(SRUMarc21BibliographicalReader):
     def _prepare_get_by_id_query(cls, identifier: str) -> str:
         return f'bib.anywhere all ("{identifier}")'
 
+    @classmethod
+    def get_by_id(cls, identifier: str) -> Marc21BibliographicalRecord:
+        try:
+            return cls.get_many_by_id([identifier])[identifier]
+        except KeyError:
+            raise NotFoundError(
+                f"Record with identifier {identifier} not found."
+            )
+
+    @classmethod
+    def get_many_by_id(
+            cls, identifiers: List[str]
+    ) -> Dict[str, Marc21BibliographicalRecord]:
+        """Get multiple records by their identifiers. The identifiers are
+        combined into one query per ``GET_MANY_BY_ID_CHUNK_SIZE``
+        identifiers, to avoid a server request for every identifier.
+        Identifiers that could not be found are missing from the returned
+        dictionary."""
+        records: Dict[str, Marc21BibliographicalRecord] = {}
+        size = cls.GET_MANY_BY_ID_CHUNK_SIZE
+        for start in range(0, len(identifiers), size):
+            chunk = identifiers[start:start + size]
+            reader = cls()
+            reader.set_query(' or '.join(
+                cls._prepare_get_by_id_query(x) for x in chunk
+            ))
+            wanted = set(chunk)
+            number = max(len(chunk), cls.DEFAULT_RECORDS_PER_PAGE)
+            # Every search may match other records as well, so keep
+            # fetching until all wanted records have been found
+            while wanted and not reader.fetching_exhausted:
+                fetched = reader.fetch(number)
+                if not fetched:
+                    break
+                for i in fetched:
+                    record = reader.records[i]
+                    if record.identifier in wanted:
+                        wanted.remove(record.identifier)
+                        records[record.identifier] = record
+        return records
+
     @classmethod
     def _get_identifier(cls, data: Marc21Data) -> Optional[str]:
         return data.raw["id"]
+
+    @classmethod
+    def _get_contributors(cls, data: Marc21Data) -> List[Field]:
+        # BnF uses UNIMARC, where the author is in field 700 with the
+        # surname in subfield a and the given name in subfield b
+        names = [
+            (field.subfields.get('a'), field.subfields.get('b'))
+            for field in data.get_fields('700')
+        ]
+        return [
+            Field(f"{givenname} {surname}" if surname and givenname
+                  else (surname or givenname))
+            for surname, givenname in names if surname or givenname
+        ]
@@ -20,16 +20,24 @@ class CERLThesaurusReader(SRUReader):
         "found in material printed before the middle of the nineteenth "\
         "century - including variant spellings, forms in Latin and "\
         "other languages, and fictitious names."
+    # Keys of the fields in the records returned by sruthi
+    _HEADING_FORM_KEY = CTAS_PREFIX + 'headingForm'
+    _DISPLAY_KEY = CTAS_PREFIX + 'display'
+    _VARIANT_FORM_KEY = CTAS_PREFIX + 'variantForm'
+    _ACTIVITY_NOTE_KEY = CTAS_PREFIX + 'activityNote'
+    _BIOGRAPHICAL_DATA_KEY = CTAS_PREFIX + 'biographicalData'
+    _GEOGRAPHICAL_NOTE_KEY = CTAS_PREFIX + 'geographicalNote'
+    # Name types that are used for the name and variant names
+    _ACCEPTABLE_NAME_TYPES = frozenset({'single', 'full'})
 
     @classmethod
     def _get_acceptable_names(
             cls, namelist: List[Dict[str, str]]
     ) -> List[str]:
-        names = []
-        for name in namelist:
-            if name['name'] in ['single', 'full']:
-                names.append(name['text'])
-        return names
+        return [
+            name['text'] for name in namelist
+            if name['name'] in cls._ACCEPTABLE_NAME_TYPES
+        ]
     
     @classmethod
     def _convert_record(cls, sruthirecord: dict) -> Record:
@@ -45,18 +53,17 @@ class CERLThesaurusReader(SRUReader):
         # forms for now. Names are both in headingForm (the default
         # display name) and variantForm (multiple variant names). We will
         # use these respectively for name and variantName.
-        PREFIX = cls.CTAS_PREFIX
-        headingform = sruthirecord.get(PREFIX + 'headingForm', None)
+        headingform = sruthirecord.get(cls._HEADING_FORM_KEY, None)
         if headingform and isinstance(headingform, list):
             names = cls._get_acceptable_names(headingform)
             if len(names):
                 record.name = Field(names[0])
         # If no headingForm was defined, try display
         if not record.name:
-            display = sruthirecord.get(PREFIX + 'display', None)
+            display = sruthirecord.get(cls._DISPLAY_KEY, None)
             if display:
                 record.name = Field(display)
-        variantform = sruthirecord.get(PREFIX + 'variantForm', None)
+        variantform = sruthirecord.get(cls._VARIANT_FORM_KEY, None)
         if variantform and isinstance(variantform, list):
             names = cls._get_acceptable_names(variantform)
             record.variant_names = [Field(x) for x in names]
@@ -64,17 +71,17 @@ class CERLThesaurusReader(SRUReader):
         # Add activityNote. This field can have only one value in CT.
         # NB: this data is very inconsistent and often includes other information
         # than somebody's activity - consider ignoring
-        activitynote = sruthirecord.get(PREFIX + 'activityNote')
+        activitynote = sruthirecord.get(cls._ACTIVITY_NOTE_KEY)
         if activitynote:
             record.activities = [Field(activitynote)]
         # Add biographicalData, which appears to be in all cases the years
         # that somebody was alive or that an entity existed
-        biographicaldata = sruthirecord.get(PREFIX + 'biographicalData')
+        biographicaldata = sruthirecord.get(cls._BIOGRAPHICAL_DATA_KEY)
         if biographicaldata:
             record.timespan = Field(biographicaldata)
         # Add geographicalNote, which appears to be a country in all cases.
         # Add it to places of activity.
-        geographicalnote = sruthirecord.get(PREFIX + 'geographicalNote')
+        geographicalnote = sruthirecord.get(cls._GEOGRAPHICAL_NOTE_KEY)
         if geographicalnote:
             field = LocationField(geographicalnote)
             field.location_type = LocationField.COUNTRY
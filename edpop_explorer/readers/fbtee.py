@@ -1,9 +1,11 @@
+import os
+from contextlib import closing
 from pathlib import Path
 import sqlite3
 from rdflib import URIRef
 import requests
 from appdirs import AppDirs
-from typing import Optional
+from typing import Iterator, List, Optional
 
 from edpop_explorer import (
     Reader, BibliographicalRecord, ReaderError, Field, BIBLIOGRAPHICAL
@@ -27,6 +29,32 @@ class FBTEEReader(GetByIdBasedOnQueryMixin, Reader):
     SHORT_NAME = "French Book Trade in Enlightenment Europe (FBTEE)"
     DESCRIPTION = "Mapping the Trade of the Société Typographique de " \
         "Neuchâtel, 1769-1794"
+    AUTHOR_SEPARATOR = '\x1f'
+    DOWNLOAD_CHUNK_SIZE = 1 << 20
+    con: Optional[sqlite3.Connection] = None
+    _columns: Optional[List[str]] = None
+    # Return one row per book, with the codes and names of its authors
+    # aggregated into strings separated by AUTHOR_SEPARATOR (char(31)).
+    # The SQL text only depends on the where statement, so sqlite3's
+    # statement cache reuses the compiled statement for repeated queries.
+    _SELECT_STATEMENT = (
+        'SELECT B.*, '
+        'GROUP_CONCAT(BA.author_code, char(31)) AS author_codes, '
+        "GROUP_CONCAT(IFNULL(A.author_name, ''), char(31)) AS author_names "
+        'FROM books B '
+        'LEFT OUTER JOIN books_authors BA on B.book_code=BA.book_code '
+        'JOIN authors A on BA.author_code=A.author_code '
+        '{where_statement} '
+        'GROUP BY B.book_code ORDER BY B.book_code'
+    )
+    # Record attributes that are filled with the value of a single column,
+    # if it is not empty
+    _SIMPLE_FIELDS = (
+        ('extent', 'pages'),
+        ('place_of_publication', 'stated_publication_places'),
+        ('dating', 'stated_publication_years'),
+        ('publisher_or_printer', 'stated_publishers'),
+    )
 
     def __init__(self):
         super().__init__()
@@ -35,41 +63,142 @@ class FBTEEReader(GetByIdBasedOnQueryMixin, Reader):
         ) / 'cl.sqlite3'
 
     def prepare_data(self):
+        if self.con is not None:
+            # The connection is kept open for subsequent queries
+            return
         if not self.database_file.exists():
             self._download_database()
-        self.con = sqlite3.connect(str(self.database_file))
+        self._create_indexes()
+        # The database is only read from, so open it in read-only mode
+        self.con = sqlite3.connect(
+            f'{self.database_file.as_uri()}?mode=ro', uri=True
+        )
+        # Allow a page cache of 64 MiB and memory-map up to 256 MiB of the
+        # database file, so that repeated queries are served from memory
+        self.con.execute('PRAGMA cache_size = -65536')
+        self.con.execute('PRAGMA mmap_size = 268435456')
+        # Allow access to the columns of result rows by name
+        self.con.row_factory = sqlite3.Row
+        # Keep the temporary b-tree that is used for GROUP BY in memory
+        self.con.execute('PRAGMA temp_store = MEMORY')
+        # Queries search the titles in books_search, which is the
+        # full-text index if it is available and the books table otherwise.
+        # Temporary views can be created on a read-only connection.
+        source = 'books_fts' if self._in_schema(self.con, 'books_fts') \
+            else 'books'
+        self.con.execute(
+            'CREATE TEMP VIEW books_search AS '
+            f'SELECT rowid, full_book_title FROM main.{source}'
+        )
+
+    def _create_indexes(self):
+        """Add the indexes that the queries of this reader rely on to the
+        database file, if they do not exist yet. The downloaded database
+        does not contain them; without them, every query scans the
+        whole table of book authors and every title."""
+        try:
+            with closing(sqlite3.connect(str(self.database_file))) as con:
+                if not self._in_schema(con, 'books_authors_book_author'):
+                    # These indexes contain all columns of books_authors
+                    # and authors that are used in the join, so the tables
+                    # themselves are not read. ANALYZE gives the query
+                    # planner the statistics to choose them.
+                    con.executescript(
+                        'BEGIN;'
+                        'CREATE INDEX books_authors_book_author '
+                        'ON books_authors(book_code, author_code);'
+                        'CREATE INDEX IF NOT EXISTS authors_author_code '
+                        'ON authors(author_code, author_name);'
+                        'ANALYZE;'
+                        'COMMIT;'
+                    )
+                if not self._in_schema(con, 'books_fts'):
+                    # A full-text index with the trigram tokenizer can be
+                    # used for LIKE '%...%' queries, with the same results
+                    # as on the books table itself
+                    con.executescript(
+                        'BEGIN;'
+                        'CREATE VIRTUAL TABLE books_fts USING fts5('
+                        "full_book_title, content='books', "
+                        "content_rowid='rowid', tokenize='trigram');"
+                        "INSERT INTO books_fts(books_fts) VALUES('rebuild');"
+                        'COMMIT;'
+                    )
+        except sqlite3.Error:
+            # The database may not be writable, or this version of SQLite
+            # may not support the trigram tokenizer; queries still work
+            # without the indexes, only more slowly
+            pass
+
+    @staticmethod
+    def _in_schema(con: sqlite3.Connection, name: str) -> bool:
+        """Return whether a table, view or index with the given name
+        exists in the database."""
+        return con.execute(
+            'SELECT 1 FROM sqlite_master WHERE name = ?', (name,)
+        ).fetchone() is not None
 
     def _download_database(self):
         print('Downloading database...')
-        response = requests.get(self.DATABASE_URL)
-        if response.ok:
-            try:
+        # Write to a temporary file first, so that an interrupted download
+        # does not leave an incomplete database behind
+        temporary_file = self.database_file.with_suffix('.part')
+        try:
+            with requests.get(self.DATABASE_URL, stream=True) as response:
+                if not response.ok:
+                    raise ReaderError(
+                        'Error downloading database file from '
+                        f'{self.DATABASE_URL}'
+                    )
                 self.database_file.parent.mkdir(exist_ok=True, parents=True)
-                with open(self.database_file, 'wb') as f:
-                    f.write(response.content)
-            except OSError as err:
-                raise ReaderError(
-                    f'Error writing database file to disk: {err}'
-                )
-        else:
+                with open(temporary_file, 'wb') as f:
+                    for chunk in response.iter_content(
+                        chunk_size=self.DOWNLOAD_CHUNK_SIZE
+                    ):
+                        f.write(chunk)
+            os.replace(temporary_file, self.database_file)
+        # RequestException is a subclass of OSError, so catch it first
+        except requests.exceptions.RequestException as err:
             raise ReaderError(
-                f'Error downloading database file from {self.DATABASE_URL}'
+                f'Error downloading database file from {self.DATABASE_URL}: '
+                f'{err}'
             )
+        except OSError as err:
+            raise ReaderError(
+                f'Error writing database file to disk: {err}'
+            )
+        finally:
+            # Only left behind if the download failed
+            temporary_file.unlink(missing_ok=True)
         print(f'Successfully saved database to {self.database_file}.')
         print(f'See license: {self.DATABASE_LICENSE}')
 
     @classmethod
     def _prepare_get_by_id_query(cls, identifier: str) -> SQLPreparedQuery:
         return SQLPreparedQuery(
-            where_statement="WHERE book_code = ?",
-            arguments=[identifier]
+            where_statement="WHERE B.book_code = ?",
+            arguments=(identifier,)
         )
 
     @classmethod
     def transform_query(cls, query: str) -> SQLPreparedQuery:
+        if not query.strip():
+            # An empty query would match every book; return no results
+            # without reading the database
+            return SQLPreparedQuery(where_statement='WHERE 0', arguments=())
+        if len(query) < 3:
+            # The trigram index cannot be used for queries shorter than
+            # three characters, and for those it does not give the same
+            # results as the books table for non-ASCII letters; search
+            # the books table itself
+            return SQLPreparedQuery(
+                where_statement='WHERE B.full_book_title LIKE ?',
+                arguments=(f'%{query}%',)
+            )
         return SQLPreparedQuery(
-            where_statement='WHERE full_book_title LIKE ?',
-            arguments=[f'%{query}%']
+            where_statement='WHERE B.rowid IN (SELECT rowid FROM '
+                            'books_search WHERE full_book_title LIKE ?)',
+            arguments=(f'%{query}%',)
         )
 
     @classmethod
@@ -79,22 +208,61 @@ class FBTEEReader(GetByIdBasedOnQueryMixin, Reader):
         if record.data['languages']:
             languages = record.data['languages'].split(sep=', ')
             record.languages = [Field(x) for x in languages]
-        pages = record.data['pages']
-        if pages:
-            record.extent = Field(pages)
-        place = record.data['stated_publication_places']
-        if place:
-            record.place_of_publication = Field(place)
-        year = record.data['stated_publication_years']
-        if year:
-            record.dating = Field(year)
-        publisher = record.data['stated_publishers']
-        if publisher:
-            record.publisher_or_printer = Field(publisher)
-        record.contributors = []
-        for author in record.data['authors']:
-            # author is tuple of author code and author name
-            record.contributors.append(Field(author[1]))
+        for attribute, column in cls._SIMPLE_FIELDS:
+            value = record.data[column]
+            if value:
+                setattr(record, attribute, Field(value))
+        # author is tuple of author code and author name
+        record.contributors = [
+            Field(author[1]) for author in record.data['authors']
+        ]
+
+    @classmethod
+    def _get_columns(cls, cur: sqlite3.Cursor) -> List[str]:
+        """Return the names of the columns of the books table. They are
+        only read from the database the first time, because the schema
+        does not change."""
+        if cls._columns is None:
+            cls._columns = [
+                x[1] for x in cur.execute('PRAGMA table_info(books)')
+            ]
+        return cls._columns
+
+    def _iter_records(
+        self, prepared_query: SQLPreparedQuery
+    ) -> Iterator[BibliographicalRecord]:
+        """Yield the records that match the query one by one, as they
+        are read from the database."""
+        cur = self.con.cursor()
+        columns = self._get_columns(cur)
+        res = cur.execute(
+            self._SELECT_STATEMENT.format(
+                where_statement=prepared_query.where_statement
+            ),
+            prepared_query.arguments
+        )
+        # %-formatting is cheaper than str.format for a single value
+        link_format = self.FBTEE_LINK.replace('{}', '%s')
+        for row in res:
+            book_code: str = row['book_code']
+            record = BibliographicalRecord(self.__class__)
+            # zip stops at the end of columns, so the author columns
+            # at the end of the row are left out
+            record.data = dict(zip(columns, row))
+            record.identifier = book_code
+            record.link = link_format % book_code
+            # Authors are tuples of author code and author name
+            author_codes = row['author_codes']
+            author_names = row['author_names']
+            if author_codes is not None:
+                record.data['authors'] = list(zip(
+                    author_codes.split(self.AUTHOR_SEPARATOR),
+                    author_names.split(self.AUTHOR_SEPARATOR)
+                ))
+            else:
+                record.data['authors'] = []
+            self._add_fields(record)
+            yield record
 
     def fetch_range(self, range_to_fetch: range) -> range:
         # This method always fetches all data at once. This could be avoided,
@@ -105,41 +273,8 @@ class FBTEEReader(GetByIdBasedOnQueryMixin, Reader):
             raise ReaderError('First call prepare_query method')
         if self.fetching_exhausted:
             return range(0)
-        cur = self.con.cursor()
-        columns = [x[1] for x in cur.execute('PRAGMA table_info(books)')]
-        res = cur.execute(
-            'SELECT B.*, BA.author_code, A.author_name FROM books B '
-            'LEFT OUTER JOIN books_authors BA on B.book_code=BA.book_code '
-            'JOIN authors A on BA.author_code=A.author_code '
-            f'{self.prepared_query.where_statement} '
-            'ORDER BY B.book_code',
-            self.prepared_query.arguments
-        )
-        last_book_code = ''
-        i = -1
-        for row in res:
-            # Since we are joining with another table, a book may be repeated,
-            # so check if this is a new item
-            book_code: str = row[columns.index('book_code')]
-            if last_book_code != book_code:
-                # We have a new book, so update i
-                i += 1
-                record = BibliographicalRecord(self.__class__)
-                record.data = {}
-                for j in range(len(columns)):
-                    record.data[columns[j]] = row[j]
-                record.identifier = book_code
-                record.link = self.FBTEE_LINK.format(book_code)
-                record.data['authors'] = []
-                self.records[i] = record
-                last_book_code = book_code
-            # Add author_code and author_name to the last record
-            assert len(self.records) > 0
-            author_code = row[len(columns)]
-            author_name = row[len(columns) + 1]
-            assert isinstance(self.records[i].data, dict)
-            self.records[i].data['authors'].append((author_code, author_name))
-        for record in self.records:
-            self._add_fields(record)
+        records = self.records
+        for i, record in enumerate(self._iter_records(self.prepared_query)):
+            records[i] = record
         self.number_of_results = len(self.records)
         return range(0, len(self.records))
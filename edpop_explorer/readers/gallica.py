@@ -6,6 +6,9 @@ import requests
 import xmltodict
 
 
+MIME_TYPE_PATTERN = re.compile(r'^[a-z]+/[a-z]+$')
+
+
 def _force_list(data) -> list:
     if isinstance(data, list):
         return data
@@ -20,7 +23,7 @@ def _force_string(data) -> Optional[str]:
     string is expected, but if there is a possibility that it is a
     list.'''
     if isinstance(data, list):
-        return ' ; '.join([str(x) for x in data])
+        return ' ; '.join(map(str, data))
     elif data is None:
         return None
     else:
@@ -55,12 +58,6 @@ class GallicaReader(SRUReader):
             if identifier.startswith(cls.IDENTIFIER_PREFIX):
                 record.identifier = identifier[len(cls.IDENTIFIER_PREFIX):]
                 record.link = identifier
-        record.data = {}
-        for key in sruthirecord:
-            if key in ['schema', 'id']:
-                continue
-            showkey: str = key.replace(cls.CTAS_PREFIX, 'ctas:')
-            record.data[showkey] = sruthirecord[key]
         record.data = sruthirecord
         title = _force_string(sruthirecord.get('title', None))
         if title:
@@ -83,7 +80,7 @@ class GallicaReader(SRUReader):
         format_strings = _force_list(sruthirecord.get('format', None))
         for formatstr in format_strings:
             if not (formatstr.startswith('Nombre total de vues') or
-                    re.match('$[a-z]+/[a-z]+^', formatstr)):
+                    MIME_TYPE_PATTERN.match(formatstr)):
                 record.extent = Field(formatstr)
                 break
 
@@ -10,6 +10,8 @@ class HPBReader(SRUMarc21BibliographicalReader):
     sru_url = 'http://sru.k10plus.de/hpb'
     sru_version = '1.1'
     HPB_LINK = 'http://hpb.cerl.org/record/{}'
+    # Prefix of the value of field 035 that contains the record id
+    _CERL_PREFIX = '(CERL)'
     CATALOG_URIREF = URIRef(
         'https://edpop.hum.uu.nl/readers/hpb'
     )
@@ -38,12 +40,11 @@ class HPBReader(SRUMarc21BibliographicalReader):
         # with (CERL), like this: (CERL)HU-SzSEK.01.bibJAT603188.
         # The URI can then be created using HPB_URI.
         # HPB records have field 035 two times.
-        fields035 = data.get_fields('035')
-        for field in fields035:
-            if 'a' in field.subfields and \
-                    field.subfields['a'].startswith('(CERL)'):
-                return field.subfields['a'][len('(CERL)'):]
-
+        for field in data.get_fields('035'):
+            value = field.subfields.get('a')
+            if value is not None and value.startswith(cls._CERL_PREFIX):
+                return value[len(cls._CERL_PREFIX):]
+        return None
 
     @classmethod
     def _get_link(cls, data: Marc21Data) -> Optional[str]:
@@ -8,6 +8,8 @@ class KBReader(SRUReader):
     sru_url = 'http://jsru.kb.nl/sru'
     sru_version = '1.2'
     KB_LINK = 'https://webggc.oclc.org/cbs/DB=2.37/PPN?PPN={}'
+    # Prefix of the OAI-PMH identifier that is followed by the PPN
+    _PPN_PREFIX = 'GGC:AC:'
     CATALOG_URIREF = URIRef(
         'https://edpop.hum.uu.nl/readers/kb'
     )
@@ -32,11 +34,9 @@ class KBReader(SRUReader):
         return None if PPN cannot be found"""
         # This seems to work fine; not thoroughly tested.
         oai_pmh_identifier = data.get('OaiPmhIdentifier', None)
-        if not isinstance(oai_pmh_identifier, str):
-            return None
-        PREFIX = 'GGC:AC:'
-        if oai_pmh_identifier and oai_pmh_identifier.startswith(PREFIX):
-            return oai_pmh_identifier[len(PREFIX):]
+        if isinstance(oai_pmh_identifier, str) and \
+                oai_pmh_identifier.startswith(self._PPN_PREFIX):
+            return oai_pmh_identifier[len(self._PPN_PREFIX):]
         return None
 
     def _convert_record(self, sruthirecord: dict) -> BibliographicalRecord:
@@ -57,16 +57,14 @@ class KBReader(SRUReader):
         return record
     
     def _get_title(self, data) -> Optional[Field]:
-        if 'title' in data:
-            title = data['title']
-            if isinstance(title, list):
-                # Title contains a list of strings if it consists of multiple
-                # parts
-                return Field(' : '.join(title))
-            else:
-                return Field(title)
-        else:
+        title = data.get('title')
+        if title is None:
             return None
+        if isinstance(title, list):
+            # Title contains a list of strings if it consists of multiple
+            # parts
+            return Field(' : '.join(title))
+        return Field(title)
 
     def _get_languages(self, data) -> Optional[List[Field]]:
         # The 'language' field contains a list of languages, where every
@@ -1,6 +1,7 @@
 import csv
+import os
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 from edpop_explorer import Reader, ReaderError, BibliographicalRecord
 from rdflib import URIRef
 
@@ -16,6 +17,16 @@ class PierreBelleReader(Reader):
     SHORT_NAME = "Pierre and Belle"
     DESCRIPTION = "Bibliography of early modern editions of Pierre de " \
         "Provence et la Belle Maguelonne (ca. 1470-ca. 1800)"
+    _header: List[str] = []
+    """The column names of the CSV file."""
+    _rows: Optional[List[List[str]]] = None
+    """The rows of the CSV file; read on first use by ``_load()``."""
+    _loaded_mtime: Optional[float] = None
+    """The modification time of the CSV file when it was read."""
+    _rows_by_id: Dict[str, List[str]] = {}
+    _haystacks: List[str] = []
+    """For every row, the casefolded values of all columns joined into
+    a single string, to search in all columns at once."""
 
     @classmethod
     def _convert_record(cls, rawrecord: dict) -> BibliographicalRecord:
@@ -34,32 +45,62 @@ class PierreBelleReader(Reader):
         # No transformation needed
         return query
 
+    @classmethod
+    def _load(cls) -> List[List[str]]:
+        """Read the CSV file into memory, if this has not been done yet
+        or if the file has changed since, and return its rows. The file
+        is small, so it is kept in memory for subsequent queries. Rows
+        are kept as lists; use ``_row_to_dict()`` to convert a row to a
+        dictionary."""
+        mtime = os.path.getmtime(cls.FILENAME)
+        if cls._rows is None or mtime != cls._loaded_mtime:
+            with open(cls.FILENAME, 'r', encoding='utf-8-sig') as file:
+                reader = csv.reader(file, delimiter=';')
+                header = next(reader)
+                # Skip blank lines, like csv.DictReader does
+                rows = [row for row in reader if row]
+            id_index = header.index('ID')
+            cls._rows_by_id = {row[id_index]: row for row in rows}
+            # Join with a control character that cannot be part of a
+            # query, so that a match cannot span two columns
+            cls._haystacks = ['\x1f'.join(row).casefold() for row in rows]
+            cls._header = header
+            cls._rows = rows
+            cls._loaded_mtime = mtime
+        return cls._rows
+
+    @classmethod
+    def _row_to_dict(cls, row: List[str]) -> Dict[str, str]:
+        # Leave out values beyond the header and fill in missing values
+        # with empty strings, so that all rows have the same keys
+        header = cls._header
+        return dict(zip(header, row + [''] * (len(header) - len(row))))
+
     @classmethod
     def get_by_id(cls, identifier: str) -> BibliographicalRecord:
-        with open(cls.FILENAME, 'r', encoding='utf-8-sig') as file:
-            reader = csv.DictReader(file, delimiter=';')
-            for row in reader:
-                if row['ID'] == identifier:
-                    return cls._convert_record(row)
-        raise ReaderError(f"Item with id {identifier} does not exist.")
+        cls._load()
+        try:
+            row = cls._rows_by_id[identifier]
+        except KeyError:
+            raise ReaderError(f"Item with id {identifier} does not exist.")
+        return cls._convert_record(cls._row_to_dict(row))
     
     def _perform_query(self) -> List[BibliographicalRecord]:
         assert isinstance(self.prepared_query, str)
         
-        # Search query in all columns, and fetch results based on query
-        results = []
-        with open(self.__class__.FILENAME, 'r', encoding='utf-8-sig') as file:
-            reader = csv.DictReader(file, delimiter=';')
-            for row in reader:
-                for key in row.keys():
-                    if self.prepared_query in row[key]:
-                        results.append(row)
-                        break
+        # Search query in all columns (case-insensitively), and fetch
+        # results based on query
+        query = self.prepared_query.casefold()
+        rows = self._load()
+        results = [
+            row for row, haystack in zip(rows, self._haystacks)
+            if query in haystack
+        ]
         
         self.number_of_results = len(results)
         records = []
         for result in results:
-            record = self._convert_record(result)
+            record = self._convert_record(self._row_to_dict(result))
             records.append(record)
 
         return records
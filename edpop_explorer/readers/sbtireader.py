@@ -3,11 +3,12 @@ import requests
 from typing import List, Dict, Optional
 
 from edpop_explorer import (
-    Reader, Record, ReaderError, BiographicalRecord, Field
+    Reader, Record, ReaderError, BiographicalRecord, Field, PagedFetchMixin
 )
+from edpop_explorer.session import create_session
 
 
-class SBTIReader(Reader):
+class SBTIReader(PagedFetchMixin, Reader):
     api_url = 'https://data.cerl.org/sbti/_search'
     api_by_id_base_url = 'https://data.cerl.org/sbti/'
     link_base_url = 'https://data.cerl.org/sbti/'
@@ -18,10 +19,21 @@ class SBTIReader(Reader):
     )
     IRI_PREFIX = "https://edpop.hum.uu.nl/readers/sbti/"
     DEFAULT_RECORDS_PER_PAGE = 10
+    _session: Optional[requests.Session] = None
+    '''The ``Session`` shared by all SBTI requests, so that connections
+    are kept alive; created on first use by ``_get_session()``.'''
     SHORT_NAME = "Scottish Book Trade Index (SBTI)"
     DESCRIPTION = "An index of the names, trades and addresses of people "\
         "involved in printing in Scotland up to 1850"
 
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        if cls._session is None:
+            session = create_session()
+            session.headers['Accept'] = 'application/json'
+            cls._session = session
+        return cls._session
+
     @classmethod
     def _get_name_field(cls, data: dict) -> Optional[Field]:
         field = None
@@ -36,11 +48,8 @@ class SBTIReader(Reader):
     @classmethod
     def get_by_id(cls, identifier: str) -> BiographicalRecord:
         try:
-            response = requests.get(
-                cls.api_by_id_base_url + identifier,
-                headers={
-                    'Accept': 'application/json'
-                },
+            response = cls._get_session().get(
+                cls.api_by_id_base_url + identifier
             ).json()
         except requests.exceptions.JSONDecodeError:
             raise ReaderError(f"Item with id {identifier} does not exist.")
@@ -88,7 +97,7 @@ class SBTIReader(Reader):
             maximum_records = self.DEFAULT_RECORDS_PER_PAGE
         print(f'The query is: {self.prepared_query}')
         try:
-            response = requests.get(
+            response = self._get_session().get(
                 self.api_url,
                 params={
                     'query': self.prepared_query,
@@ -96,9 +105,6 @@ class SBTIReader(Reader):
                     'size': maximum_records,
                     'mode': 'default',
                     'sort': 'default'
-                },
-                headers={
-                    'Accept': 'application/json'
                 }
             ).json()
         except (
@@ -131,15 +137,7 @@ class SBTIReader(Reader):
         # No transformation needed
         return query
 
-    def fetch_range(self, range_to_fetch: range) -> range:
-        if self.prepared_query is None:
-            raise ReaderError('First call prepare_query')
-        if self.fetching_exhausted:
-            return range(0)
-        start_record = range_to_fetch.start
-        number_to_fetch = range_to_fetch.stop - start_record
-        results = self._perform_query(start_record, number_to_fetch)
-        for i, result in enumerate(results):
-            self.records[i] = result
-        return range(start_record, start_record + len(results))
-
+    def _perform_page_query(
+            self, start_number: int, number_of_records: int
+    ) -> List[Record]:
+        return self._perform_query(start_number, number_of_records)
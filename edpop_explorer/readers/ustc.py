@@ -1,6 +1,6 @@
 from pathlib import Path
 import sqlite3
-from typing import List, Optional, Union
+from typing import Optional
 from appdirs import AppDirs
 from rdflib import URIRef
 
@@ -56,8 +56,7 @@ class USTCReader(GetByIdBasedOnQueryMixin, Reader):
             'OR E.author_name_8 LIKE ? '
         )
         like_argument = '%' + query + '%'
-        arguments: List[Union[str, int]] = [like_argument for _ in range(9)]
-        return SQLPreparedQuery(where_statement, arguments)
+        return SQLPreparedQuery(where_statement, (like_argument,) * 9)
 
     @classmethod
     def _prepare_get_by_id_query(cls, identifier: str) -> SQLPreparedQuery:
@@ -67,7 +66,7 @@ class USTCReader(GetByIdBasedOnQueryMixin, Reader):
             raise ReaderError(f"Identifier {identifier} is not an integer")
         return SQLPreparedQuery(
             where_statement="WHERE E.sn = ?",
-            arguments=[identifier_int]
+            arguments=(identifier_int,)
         )
 
     def fetch_range(self, range_to_fetch: range) -> range:
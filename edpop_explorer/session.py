@@ -0,0 +1,60 @@
+import os
+import requests
+import warnings
+from appdirs import AppDirs
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import Optional
+from urllib3.util.retry import Retry
+
+
+# A single adapter is shared by the sessions of all readers, so that their
+# connections are pooled and kept alive across reader instances, while
+# every reader still has its own session parameters.
+HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    ),
+)
+
+CACHE_ENVIRONMENT_VARIABLE = 'EDPOP_SRU_CACHE'
+"""Set this environment variable to ``1`` to cache SRU responses on disk
+for a day. This requires the optional ``requests-cache`` package."""
+CACHE_EXPIRE_AFTER = 86400
+
+
+def create_session(cache_name: Optional[str] = None) -> requests.Session:
+    """Create a ``requests`` session that uses the shared
+    ``HTTP_ADAPTER``. If ``cache_name`` is given and caching is enabled
+    with the ``CACHE_ENVIRONMENT_VARIABLE`` environment variable,
+    responses are cached on disk under that name."""
+    session: Optional[requests.Session] = None
+    if cache_name is not None and \
+            os.environ.get(CACHE_ENVIRONMENT_VARIABLE) == '1':
+        try:
+            import requests_cache
+        except ImportError:
+            warnings.warn(
+                f'{CACHE_ENVIRONMENT_VARIABLE} is set but requests-cache is '
+                'not installed; responses will not be cached'
+            )
+        else:
+            cache_dir = Path(AppDirs('edpop-explorer', 'cdh').user_cache_dir)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # Responses are cached by URL, which includes the query and
+            # the requested range of records
+            session = requests_cache.CachedSession(
+                cache_name=str(cache_dir / cache_name),
+                backend='sqlite',
+                expire_after=CACHE_EXPIRE_AFTER,
+            )
+    if session is None:
+        session = requests.Session()
+    session.mount('http://', HTTP_ADAPTER)
+    session.mount('https://', HTTP_ADAPTER)
+    return session
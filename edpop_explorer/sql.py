@@ -1,10 +1,16 @@
 from dataclasses import dataclass
-from typing import List, Union
+from typing import Tuple, Union
 
 from edpop_explorer import BasePreparedQuery
 
 
-@dataclass
+@dataclass(frozen=True)
 class SQLPreparedQuery(BasePreparedQuery):
+    __slots__ = ('where_statement', 'arguments')
     where_statement: str
-    arguments: List[Union[str, int]]
+    arguments: Tuple[Union[str, int], ...]
+
+    def __post_init__(self) -> None:
+        # Store the arguments as a tuple, also if they are given as a
+        # list, so that prepared queries can be hashed
+        object.__setattr__(self, 'arguments', tuple(self.arguments))
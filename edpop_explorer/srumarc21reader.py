@@ -146,33 +146,34 @@ class SRUMarc21Reader(SRUReader):
         # The controlfield and the datafield contain multiple fields.
         # The controlfield consists of simple pairs of tags (field numbers)
         # and texts (field values).
-        for sruthicontrolfield in \
-                sruthirecord[f'{cls.marcxchange_prefix}controlfield']:
-            tag = sruthicontrolfield['tag']
-            text = sruthicontrolfield['text']
-            data.controlfields[tag] = text
+        data.controlfields = {
+            sruthicontrolfield['tag']: sruthicontrolfield['text']
+            for sruthicontrolfield
+            in sruthirecord[f'{cls.marcxchange_prefix}controlfield']
+        }
         # The datafield is more complex; these fields also have two indicators,
         # one-digit numbers that carry special meanings, and multiple subfields
         # that each have a one-character code.
+        # Bind the methods that are called for every field to locals
+        append_field = data.fields.append
+        get_subfields = cls._get_subfields
+        get_description = translation_dictionary.get
         for sruthifield in sruthirecord[f'{cls.marcxchange_prefix}datafield']:
             fieldnumber = sruthifield['tag']
+            # The translation_dictionary contains descriptions for a number
+            # of important fields. Include them so that the user can more
+            # easily understand the record.
             field = Marc21Field(
                 fieldnumber=fieldnumber,
                 indicator1=sruthifield['ind1'],
                 indicator2=sruthifield['ind2'],
-                subfields={}
+                subfields={
+                    sruthisubfield['code']: sruthisubfield['text']
+                    for sruthisubfield in get_subfields(sruthifield)
+                },
+                description=get_description(fieldnumber)
             )
-            # The translation_dictionary contains descriptions for a number
-            # of important fields. Include them so that the user can more
-            # easily understand the record.
-            if fieldnumber in translation_dictionary:
-                field.description = translation_dictionary[fieldnumber]
-            sruthisubfields = cls._get_subfields(sruthifield)
-
-            for sruthisubfield in sruthisubfields:
-                field.subfields[sruthisubfield['code']] = \
-                    sruthisubfield['text']
-            data.fields.append(field)
+            append_field(field)
         return data
     
     @classmethod
@@ -267,11 +268,8 @@ class SRUMarc21BibliographicalReader(SRUMarc21Reader):
 
     @classmethod
     def _get_contributors(cls, data: Marc21Data) -> List[Field]:
-        contributors: List[Field] = []
-        contributor_fields = data.get_fields('100')
-        for field in contributor_fields:
-            name = field.subfields.get('a')
-            if name:
-                contributors.append(Field(name))
-        return contributors
+        return [
+            Field(name) for field in data.get_fields('100')
+            if (name := field.subfields.get('a'))
+        ]
 
@@ -1,13 +1,15 @@
 import sruthi
 import requests
 from abc import abstractmethod
+from itertools import islice
 from typing import List, Optional
 
 from edpop_explorer import Reader, Record, ReaderError
-from edpop_explorer.reader import GetByIdBasedOnQueryMixin
+from edpop_explorer.reader import GetByIdBasedOnQueryMixin, PagedFetchMixin
+from edpop_explorer.session import create_session
 
 
-class SRUReader(GetByIdBasedOnQueryMixin, Reader):
+class SRUReader(GetByIdBasedOnQueryMixin, PagedFetchMixin, Reader):
     '''Subclass of ``Reader`` that adds basic SRU functionality
     using the ``sruthi`` library.
 
@@ -33,7 +35,7 @@ class SRUReader(GetByIdBasedOnQueryMixin, Reader):
         # parameters and settings, which some SRU APIs require -
         # see https://github.com/metaodi/sruthi#custom-parameters-and-settings
         super().__init__()
-        self.session = requests.Session()
+        self.session = create_session(cache_name='sru')
 
     @classmethod
     @abstractmethod
@@ -71,7 +73,10 @@ class SRUReader(GetByIdBasedOnQueryMixin, Reader):
         self.number_of_results = response.count
 
         records: List[Record] = []
-        for sruthirecord in response[0:maximum_records]:
+        # Do not slice the response: sruthi loads the next page when
+        # slicing up to the number of records that is already available,
+        # while islice stops iterating once enough records have been read.
+        for sruthirecord in islice(response, maximum_records):
             records.append(self._convert_record(sruthirecord))
 
         return records
@@ -79,17 +84,8 @@ class SRUReader(GetByIdBasedOnQueryMixin, Reader):
     def prepare_query(self, query) -> None:
         self.prepared_query = self.transform_query(query)
 
-    def fetch_range(self, range_to_fetch: range) -> range:
-        # SRU provides paged retrieve using a start record (that starts at
-        # 1, while we start at 0) and a maximum number of results.
-        if self.fetching_exhausted:
-            return range(0, 0)
-        if self.prepared_query is None:
-            raise ReaderError('First call prepare_query')
-        start_number = range_to_fetch.start
-        start_number_sru = start_number + 1  # SRU starts at 1
-        records_to_fetch = range_to_fetch.stop - range_to_fetch.start
-        results = self._perform_query(start_number_sru, records_to_fetch)
-        for i, result in enumerate(results):
-            self.records[i + start_number] = result
-        return range(start_number, start_number + len(results))
+    def _perform_page_query(
+            self, start_number: int, number_of_records: int
+    ) -> List[Record]:
+        # SRU starts counting records at 1, while we start at 0
+        return self._perform_query(start_number + 1, number_of_records)
@@ -0,0 +1,62 @@
+import re
+from typing import List, Optional
+
+import pytest
+
+from edpop_explorer import NotFoundError, Record
+from edpop_explorer.readers import BnFReader
+
+
+class StubBnFReader(BnFReader):
+    """A BnF reader that does not access the server. Every search also
+    matches a number of unrelated records, which come first."""
+    GET_MANY_BY_ID_CHUNK_SIZE = 3
+    NUMBER_OF_UNRELATED_RECORDS = 25
+    EXISTING_IDENTIFIERS = {f"id{i}" for i in range(10)}
+    queries: List[str] = []
+
+    def _perform_query(
+            self, start_record: int, maximum_records: Optional[int]
+    ) -> List[Record]:
+        assert isinstance(self.prepared_query, str)
+        assert maximum_records is not None
+        self.queries.append(self.prepared_query)
+        identifiers = [
+            f"unrelated{i}" for i in range(self.NUMBER_OF_UNRELATED_RECORDS)
+        ] + [
+            x for x in re.findall(r'"([^"]+)"', self.prepared_query)
+            if x in self.EXISTING_IDENTIFIERS
+        ]
+        self.number_of_results = len(identifiers)
+        records = []
+        # SRU starts at 1
+        for identifier in identifiers[
+                start_record - 1:start_record - 1 + maximum_records]:
+            record = Record(self.__class__)
+            record.identifier = identifier
+            records.append(record)
+        return records
+
+
+@pytest.fixture(autouse=True)
+def clear_queries():
+    StubBnFReader.queries = []
+
+
+def test_get_many_by_id():
+    identifiers = ["id1", "id2", "id3", "id4", "missing", "id5", "id6"]
+    records = StubBnFReader.get_many_by_id(identifiers)
+    assert sorted(records) == ["id1", "id2", "id3", "id4", "id5", "id6"]
+    for identifier, record in records.items():
+        assert record.identifier == identifier
+    # Three chunks of at most three identifiers, each of which needs
+    # more than one page because of the unrelated records
+    chunks = set(StubBnFReader.queries)
+    assert len(chunks) == 3
+    assert len(StubBnFReader.queries) > 3
+
+
+def test_get_by_id():
+    assert StubBnFReader.get_by_id("id7").identifier == "id7"
+    with pytest.raises(NotFoundError):
+        StubBnFReader.get_by_id("missing")
@@ -0,0 +1,158 @@
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Type
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from edpop_explorer import NotFoundError, ReaderError
+from edpop_explorer.readers import FBTEEReader
+
+
+BOOKS = [
+    # book_code, full_book_title, languages, pages,
+    # stated_publication_places, stated_publication_years,
+    # stated_publishers
+    ('b1', 'Histoire de Pierre', 'French, Latin', '300', 'Neuchâtel',
+     '1775', 'STN'),
+    ('b2', 'Histoire naturelle', 'French', '', '', '1780', ''),
+    ('b3', 'Traité des études', 'French', '', '', '', ''),
+    ('b4', 'ÉTUDES sur Paris', 'French', '', '', '', ''),
+    ('b5', 'Œuvres complètes', 'French', '', '', '', ''),
+]
+AUTHORS = [
+    ('a1', 'Voltaire'),
+    ('a2', 'Rousseau'),
+    ('a3', None),
+]
+BOOKS_AUTHORS = [
+    ('b1', 'a1'),
+    ('b1', 'a2'),
+    ('b2', 'a3'),
+    ('b3', 'a2'),
+    ('b4', 'a1'),
+    ('b5', 'a1'),
+]
+
+
+def _create_database(path: Path) -> None:
+    with closing(sqlite3.connect(str(path))) as con:
+        con.executescript(
+            'CREATE TABLE books (book_code TEXT, full_book_title TEXT, '
+            'languages TEXT, pages TEXT, stated_publication_places TEXT, '
+            'stated_publication_years TEXT, stated_publishers TEXT);'
+            'CREATE TABLE authors (author_code TEXT, author_name TEXT);'
+            'CREATE TABLE books_authors (book_code TEXT, author_code TEXT);'
+        )
+        con.executemany(
+            'INSERT INTO books VALUES (?, ?, ?, ?, ?, ?, ?)', BOOKS
+        )
+        con.executemany('INSERT INTO authors VALUES (?, ?)', AUTHORS)
+        con.executemany(
+            'INSERT INTO books_authors VALUES (?, ?)', BOOKS_AUTHORS
+        )
+        con.commit()
+
+
+def _reader_class(path: Path, create_indexes: bool) -> Type[FBTEEReader]:
+    _create_database(path)
+
+    class TemporaryFBTEEReader(FBTEEReader):
+        def __init__(self):
+            super().__init__()
+            self.database_file = path
+
+        def _create_indexes(self):
+            if create_indexes:
+                super()._create_indexes()
+
+    return TemporaryFBTEEReader
+
+
+@pytest.fixture
+def reader_class(tmp_path) -> Type[FBTEEReader]:
+    return _reader_class(tmp_path / 'cl.sqlite3', True)
+
+
+@pytest.fixture
+def reader_class_without_indexes(tmp_path) -> Type[FBTEEReader]:
+    return _reader_class(tmp_path / 'cl_plain.sqlite3', False)
+
+
+def _search(readercls: Type[FBTEEReader], query: str) -> dict:
+    reader = readercls()
+    reader.prepare_query(query)
+    reader.fetch()
+    return {
+        record.identifier: sorted(record.data['authors'])
+        for record in reader.records.values()
+    }
+
+
+def test_authors(reader_class):
+    reader = reader_class()
+    reader.prepare_query('Histoire')
+    reader.fetch()
+    assert reader.number_of_results == 2
+    records = {
+        record.identifier: record for record in reader.records.values()
+    }
+    first = records['b1']
+    assert sorted(first.data['authors']) == \
+        [('a1', 'Voltaire'), ('a2', 'Rousseau')]
+    assert sorted(str(x) for x in first.contributors) == \
+        ['Rousseau', 'Voltaire']
+    assert [str(x) for x in first.languages] == ['French', 'Latin']
+    assert str(first.place_of_publication) == 'Neuchâtel'
+    assert first.link.endswith('id=b1')
+    # An author without a name
+    assert records['b2'].data['authors'] == [('a3', '')]
+    assert records['b2'].extent is None
+
+
+@pytest.mark.parametrize('query', [
+    'Histoire', 'histoire', 'de', 'xyz', 'é', 'ÉT', 'Ét', 'ét', 'Œu', 'œu',
+    'ÉTU', 'étu', 'Œuv',
+])
+def test_search_with_and_without_indexes(
+        reader_class, reader_class_without_indexes, query
+):
+    reader = reader_class()
+    reader.prepare_data()
+    assert reader._in_schema(reader.con, 'books_fts')
+    without_indexes = reader_class_without_indexes()
+    without_indexes.prepare_data()
+    assert not without_indexes._in_schema(without_indexes.con, 'books_fts')
+    assert _search(reader_class, query) == \
+        _search(reader_class_without_indexes, query)
+
+
+def test_empty_query(reader_class):
+    assert _search(reader_class, ' ') == {}
+
+
+def test_get_by_id(reader_class):
+    record = reader_class.get_by_id('b3')
+    assert record.identifier == 'b3'
+    assert str(record.title) == 'Traité des études'
+    assert record.data['authors'] == [('a2', 'Rousseau')]
+    with pytest.raises(NotFoundError):
+        reader_class.get_by_id('b9')
+
+
+@patch('edpop_explorer.readers.fbtee.requests.get')
+def test_download_interrupted(mock_get, tmp_path):
+    def iter_content(chunk_size):
+        yield b'SQLite format 3'
+        raise requests.exceptions.ConnectionError('Connection reset')
+    response = MagicMock()
+    response.ok = True
+    response.iter_content = iter_content
+    mock_get.return_value.__enter__.return_value = response
+    reader = FBTEEReader()
+    reader.database_file = tmp_path / 'cl.sqlite3'
+    with pytest.raises(ReaderError, match='Error downloading'):
+        reader._download_database()
+    assert list(tmp_path.iterdir()) == []
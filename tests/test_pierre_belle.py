@@ -0,0 +1,56 @@
+from edpop_explorer.readers import PierreBelleReader
+
+
+def _search(query: str) -> int:
+    reader = PierreBelleReader()
+    reader.prepare_query(query)
+    reader.fetch()
+    assert reader.number_of_results is not None
+    return reader.number_of_results
+
+
+def test_query_is_phrase():
+    # A query with spaces is matched as a whole, not word by word
+    assert _search("xyzzy Pierre") == 0
+    assert 0 < _search("Pierre de Provence") < _search("Pierre")
+    reader = PierreBelleReader()
+    reader.prepare_query("pierre de provence")
+    reader.fetch()
+    for record in reader.records.values():
+        assert "pierre de provence" in \
+            "\x1f".join(record.data.values()).casefold()
+
+
+def test_get_by_id():
+    record = PierreBelleReader.get_by_id("BPB:1")
+    assert record.identifier == "BPB:1"
+
+
+def test_blank_and_irregular_lines(tmp_path):
+    csv_file = tmp_path / 'biblio.csv'
+    csv_file.write_text(
+        'ID;Shortened title;Language;Place of publication;Publisher;Date\n'
+        'T:1;Pierre;French;Lyon;Le Roy;1475\n'
+        '\n'
+        'T:2;Maguelonne;French\n'
+        'T:3;Belle;French;Paris;Trepperel;1490;extra\n'
+        '\n',
+        encoding='utf-8'
+    )
+
+    class TemporaryPierreBelleReader(PierreBelleReader):
+        FILENAME = csv_file
+        _rows = None
+
+    reader = TemporaryPierreBelleReader()
+    reader.prepare_query('')
+    reader.fetch()
+    assert reader.number_of_results == 3
+    # Missing values are empty and values beyond the header are left out
+    record = TemporaryPierreBelleReader.get_by_id('T:2')
+    assert record.data['Publisher'] == ''
+    record = TemporaryPierreBelleReader.get_by_id('T:3')
+    assert list(record.data) == [
+        'ID', 'Shortened title', 'Language', 'Place of publication',
+        'Publisher', 'Date'
+    ]
@@ -1,4 +1,6 @@
 
+import pickle
+from dataclasses import FrozenInstanceError
 from typing_extensions import override
 
 import pytest
@@ -11,8 +13,10 @@ from edpop_explorer import (
     ReaderError,
     EDPOPREC,
     GetByIdBasedOnQueryMixin,
+    PagedFetchMixin,
     NotFoundError,
 )
+from edpop_explorer.sql import SQLPreparedQuery
 
 
 class SimpleReader(Reader):
@@ -103,6 +107,17 @@ def test_fetch():
         record = reader.get(20, False)
 
 
+def test_fetching_exhausted_set_by_reader():
+    reader = SimpleReader()
+    reader.set_query("test")
+    reader.fetch(5)
+    assert not reader.fetching_exhausted
+    # Readers may signal early that no more results are available
+    reader._exhausted = True
+    assert reader.fetching_exhausted
+    assert reader.fetch() == range(0)
+
+
 def test_get_allow_fetching():
     reader = SimpleReader()
     reader.set_query("test")
@@ -163,6 +178,54 @@ def test_getbyidbasedonquerymixin_nonereturned():
         SimpleReaderGetByIdBasedOnQuery.get_by_id("nonematching")
 
 
+class SimplePagedReader(PagedFetchMixin, SimpleReader):
+    """A reader which yields 137 items in pages of at most 50 items and
+    which keeps track of the pages that were requested."""
+    NUMBER_OF_ITEMS = 137
+    MAXIMUM_RECORDS_PER_REQUEST = 50
+
+    def __init__(self):
+        super().__init__()
+        self.pages = []
+
+    @override
+    def _perform_page_query(self, start_number, number_of_records):
+        self.pages.append((start_number, number_of_records))
+        self.number_of_results = self.NUMBER_OF_ITEMS
+        stop_number = min(start_number + number_of_records,
+                          self.NUMBER_OF_ITEMS)
+        return [
+            self.get_by_id(str(i)) for i in range(start_number, stop_number)
+        ]
+
+
+def test_pagedfetchmixin():
+    reader = SimplePagedReader()
+    reader.set_query("test")
+    assert reader.fetch_range(range(0, 500)) == range(0, 137)
+    assert sorted(reader.pages) == [(0, 50), (50, 50), (100, 37)]
+    assert [reader.records[i].identifier for i in range(137)] == \
+        [str(i) for i in range(137)]
+    assert reader.fetching_exhausted
+
+
+def test_pagedfetchmixin_start_not_at_zero():
+    reader = SimplePagedReader()
+    reader.set_query("test")
+    assert reader.fetch(10) == range(0, 10)
+    # The number of results is known now, so all pages are requested
+    # at once
+    assert reader.fetch(60) == range(10, 70)
+    assert sorted(reader.pages) == [(0, 10), (10, 50), (60, 10)]
+    assert reader.records[69].identifier == "69"
+
+
+def test_pagedfetchmixin_no_query():
+    reader = SimplePagedReader()
+    with pytest.raises(ReaderError):
+        reader.fetch()
+
+
 def test_generate_identifier():
     reader = SimpleReader()
     reader.prepare_query("Hoi")
@@ -174,3 +237,14 @@ def test_generate_identifier():
     reader2.fetch()
     identifier2 = reader2.generate_identifier()
     assert identifier == identifier2
+
+
+def test_prepared_query_pickle():
+    query = SQLPreparedQuery("WHERE title LIKE ?", ("%test%",))
+    unpickled = pickle.loads(pickle.dumps(query))
+    assert unpickled == query
+    assert hash(unpickled) == hash(query)
+    # Arguments given as a list are stored as a tuple
+    assert SQLPreparedQuery("WHERE title LIKE ?", ["%test%"]) == query
+    with pytest.raises(FrozenInstanceError):
+        unpickled.where_statement = "WHERE 1"
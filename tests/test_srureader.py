@@ -3,7 +3,9 @@ import json
 from pathlib import Path
 from typing import Optional
 
-from edpop_explorer import SRUMarc21BibliographicalReader, Marc21Data
+from edpop_explorer import (
+    SRUMarc21BibliographicalReader, Marc21Data, Marc21Field
+)
 
 
 TESTDATA = json.load(open(Path(__file__).parent / 'TESTDATA', 'r'))
@@ -52,3 +54,40 @@ class TestSRUMarc21BibliographicalReader:
         assert len(data.get_fields('500')) == 5
         # Control field
         assert data.controlfields['007'] == 'tu'
+
+
+def test_marc21data_get_fields_after_adding_field():
+    data = Marc21Data()
+    data.fields.append(Marc21Field('500', ' ', ' ', {'a': 'First note'}))
+    assert len(data.get_fields('500')) == 1
+    # Fields that are added after a lookup should be found as well
+    data.fields.append(Marc21Field('500', ' ', ' ', {'a': 'Second note'}))
+    assert [x.subfields['a'] for x in data.get_fields('500')] == \
+        ['First note', 'Second note']
+    assert data.get_first_field('245') is None
+
+
+def test_sru_start_record_starts_at_one():
+    class PagedMockReader(MockReader):
+        def _perform_query(self, start_record, maximum_records):
+            self.start_records.append(start_record)
+            self.number_of_results = 0
+            return []
+    reader = PagedMockReader()
+    reader.start_records = []
+    reader.prepare_query('testquery')
+    reader.fetch_range(range(5, 10))
+    assert reader.start_records == [6]
+
+
+def test_marc21data_get_fields_after_replacing_fields():
+    data = Marc21Data()
+    data.fields = [Marc21Field('500', ' ', ' ', {'a': 'Note'})]
+    assert data.get_first_subfield('500', 'a') == 'Note'
+    # Replacing a field or the whole list should be noticed as well, also
+    # if the number of fields stays the same
+    data.fields[0] = Marc21Field('500', ' ', ' ', {'a': 'Other note'})
+    assert data.get_first_subfield('500', 'a') == 'Other note'
+    data.fields = [Marc21Field('245', ' ', ' ', {'a': 'Title'})]
+    assert data.get_first_field('500') is None
+    assert data.get_first_subfield('245', 'a') == 'Title'